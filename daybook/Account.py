@@ -1,7 +1,32 @@
 """ Account classes
 """
 
+import sys
 from collections import defaultdict
+from datetime import date, datetime
+
+from superdate import parse_date
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _to_day(bound):
+    """ Parse a balance bound down to a plain date.
+
+    Args:
+        bound: A str, date, datetime, or SuperDate. May be None.
+
+    Returns:
+        A date, or None if bound was None.
+    """
+    if bound is None:
+        return None
+
+    d = parse_date(bound)
+    return d.date() if type(d) is datetime else d
 
 
 class Account:
@@ -27,6 +52,10 @@ class Account:
         'void',
     ]
 
+    __slots__ = (
+        'type', 'name', 'transactions', 'balances', 'last_currency',
+        '_arrays', '_arrays_count')
+
     def __init__(self, name):
         """ Initialize a new account instance.
 
@@ -54,7 +83,10 @@ class Account:
         if len(fields) == 1:
             raise ValueError('Account "{}" contains a type, but no name.'.format(name))
 
-        self.name = '.'.join([self.type] + fields[1:])
+        # Interned so the name compares by pointer in the dedupe
+        # hashing and equality paths; every account with this name
+        # shares one str object.
+        self.name = sys.intern('.'.join([self.type] + fields[1:]))
 
         # transaction references
         self.transactions = []
@@ -65,6 +97,11 @@ class Account:
         # most recent currency used in a transaction
         self.last_currency = None
 
+        # Parallel per-currency (days, amounts) numpy arrays for
+        # balance(). Rebuilt lazily when the transaction count changes.
+        self._arrays = None
+        self._arrays_count = 0
+
     def addTransactions(self, transactions):
         """ Add transactions to this account.
 
@@ -77,7 +114,7 @@ class Account:
     def addTransaction(self, t):
         """ Update balances and append transaction.
         """
-        if self not in [t.src, t.dest]:
+        if self is not t.src and self is not t.dest:
             raise ValueError('Im not in this transaction')
 
         amount = t.amount
@@ -92,3 +129,90 @@ class Account:
             self.last_currency = dcurr
 
         self.transactions.append(t)
+
+    def balance(self, start=None, end=None):
+        """ Tally this account's per-currency balances over a date window.
+
+        Bounds are inclusive and compared at day granularity. With no
+        bounds this is the running self.balances.
+
+        Args:
+            start: Only count transactions on or after this date.
+            end: Only count transactions on or before this date.
+
+        Returns:
+            A dict mapping currency to balance.
+
+        Raises:
+            ValueError if a bound could not be parsed as a date.
+        """
+        if start is None and end is None:
+            return dict(self.balances)
+
+        start = _to_day(start)
+        end = _to_day(end)
+
+        if np is not None:
+            return self._balanceArrays(start, end)
+
+        return self._balanceLoop(start, end)
+
+    def _rebuildArrays(self):
+        """ Build per-currency numpy arrays from self.transactions.
+        """
+        per_cur = defaultdict(lambda: ([], []))
+        for t in self.transactions:
+            day = date(t.date.year, t.date.month, t.date.day)
+            if self is t.src:
+                days, amounts = per_cur[t.amount.src_currency]
+                days.append(day)
+                amounts.append(t.amount.src_amount)
+            if self is t.dest:
+                days, amounts = per_cur[t.amount.dest_currency]
+                days.append(day)
+                amounts.append(t.amount.dest_amount)
+
+        self._arrays = {
+            cur: (
+                np.array(days, dtype='datetime64[D]'),
+                np.array(amounts, dtype='float64'))
+            for cur, (days, amounts) in per_cur.items()}
+        self._arrays_count = len(self.transactions)
+
+    def _balanceArrays(self, start, end):
+        """ Vectorized date-window tally. Requires numpy.
+        """
+        if self._arrays is None or self._arrays_count != len(self.transactions):
+            self._rebuildArrays()
+
+        balances = {}
+        for cur, (days, amounts) in self._arrays.items():
+            mask = np.ones(len(days), dtype=bool)
+            if start is not None:
+                mask &= days >= np.datetime64(start)
+            if end is not None:
+                mask &= days <= np.datetime64(end)
+            balances[cur] = float(amounts[mask].sum())
+
+        return balances
+
+    def _balanceLoop(self, start, end):
+        """ Pure-python date-window tally for when numpy is unavailable.
+
+        Open bounds become date.min / date.max so the loop runs one
+        chained comparison per transaction instead of re-checking the
+        bounds for None every iteration.
+        """
+        start = start if start is not None else date.min
+        end = end if end is not None else date.max
+
+        balances = {cur: 0.0 for cur in self.balances}
+        for t in self.transactions:
+            day = date(t.date.year, t.date.month, t.date.day)
+            if start <= day <= end:
+                if self is t.src:
+                    balances[t.amount.src_currency] += t.amount.src_amount
+                if self is t.dest:
+                    balances[t.amount.dest_currency] += t.amount.dest_amount
+
+        return balances
@@ -70,6 +70,13 @@ class Amount:
             and self.dest_currency == other.dest_currency
             and self.dest_amount == other.dest_amount)
 
+    def __hash__(self):
+        return hash((
+            self.src_currency,
+            self.src_amount,
+            self.dest_currency,
+            self.dest_amount))
+
     @classmethod
     def createFromStr(cls, s, suggestion):
         """ Create amount from string.
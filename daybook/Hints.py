@@ -5,6 +5,11 @@ import string
 
 from daybook.util import colonconf
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 class Hints:
     def __init__(self, hints=''):
@@ -14,6 +19,12 @@ class Hints:
             hints: Path to the hints file.
         """
         self.hints = {}
+
+        # Aho-Corasick automaton over all hint lines. Searches every
+        # line in a single pass of the string instead of one scan per
+        # line. None if pyahocorasick isn't installed or no hints.
+        self._automaton = None
+
         if hints:
             self.load(hints)
 
@@ -36,6 +47,33 @@ class Hints:
             else:
                 self.hints[k].extend(lines)
 
+        self._buildAutomaton()
+
+    def _buildAutomaton(self):
+        """ Compile the hint lines into one multi-pattern automaton.
+
+        The first key to claim a line wins, matching the iteration
+        order of the fallback loop in suggest.
+        """
+        if ahocorasick is None:
+            return
+
+        lines = {}
+        for i, (k, v) in enumerate(self.hints.items()):
+            for line in v:
+                lines.setdefault(line, (i, k))
+
+        if not lines:
+            self._automaton = None
+            return
+
+        automaton = ahocorasick.Automaton()
+        for line, payload in lines.items():
+            automaton.add_word(line, payload)
+        automaton.make_automaton()
+
+        self._automaton = automaton
+
     def suggest(self, s):
         """ Suggest an entry given a string.
 
@@ -45,6 +83,13 @@ class Hints:
         Returns:
             The key in hints for which a value was a substring of s.
         """
+        if self._automaton is not None:
+            best = None
+            for _, payload in self._automaton.iter(s):
+                if best is None or payload < best:
+                    best = payload
+            return best[1] if best else ''
+
         for k, v in self.hints.items():
             if any([line in s for line in v]):
                 return k
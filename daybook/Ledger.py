@@ -1,18 +1,150 @@
 """ Ledger class and basic filter function.
 """
 
+import concurrent.futures
 import csv
+import functools
 import io
 import os
+import warnings
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+if np is not None and numba is not None:
+    @numba.njit(cache=True)
+    def _filter_mask(days, src_idx, dest_idx, start, end, acct_mask, use_accounts):
+        """ Fused candidate mask over the ledger's SoA arrays.
+
+        start and end are day ordinals; open bounds use int64
+        sentinels. acct_mask is a bool array indexed by account id and
+        is only consulted when use_accounts is set.
+        """
+        n = days.shape[0]
+        out = np.empty(n, dtype=np.bool_)
+        for i in range(n):
+            ok = start <= days[i] <= end
+            if ok and use_accounts:
+                ok = acct_mask[src_idx[i]] or acct_mask[dest_idx[i]]
+            out[i] = ok
+        return out
+else:
+    _filter_mask = None
 
 from superdate import SuperDate
 
 from daybook.Account import Account
 from daybook.Amount import Amount
-from daybook.Transaction import Transaction
+from daybook.Transaction import Transaction, parse_date
 from daybook.util.DupeTracker import DupeTracker
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_tags(s):
+    """ Split a colon-delimited tag string into a frozenset.
+
+    Clean strings - no empty or whitespace-padded segments - skip the
+    per-segment strip-and-filter pass. Results are memoized since the
+    same tag combinations recur across rows, so callers share the
+    frozenset and must copy it before mutating.
+
+    Args:
+        s: Colon-delimited tag string.
+
+    Returns:
+        A frozenset of tag strings.
+    """
+    if not s:
+        return frozenset()
+
+    if ('::' not in s and ' ' not in s and '\t' not in s
+            and not s.startswith(':') and not s.endswith(':')):
+        return frozenset(s.split(':'))
+
+    return frozenset(x.strip() for x in s.split(':') if x.strip())
+
+
+def _read_csv(csvfile):
+    """ Read a CSV into a fields dict and row sequences.
+
+    Uses pandas' C engine when available.
+
+    Args:
+        csvfile: csv file to read.
+
+    Returns:
+        A pair; a dict mapping heading names to column indices, and an
+        iterable of row sequences whose values are strings.
+
+    Raises:
+        ValueError if the file had no headings or could not be parsed.
+    """
+    if pd is not None:
+        try:
+            # index_col=False stops pandas from shifting every column
+            # when a row carries extra trailing fields; the warning it
+            # emits for those rows is silenced since the csv module
+            # ignores extra fields silently too.
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', pd.errors.ParserWarning)
+                df = pd.read_csv(
+                    csvfile, dtype=str, keep_default_na=False, index_col=False)
+        except (pd.errors.ParserError, pd.errors.EmptyDataError):
+            # pandas is a pure fast path; files it cannot parse fall
+            # back to the csv module below.
+            pass
+        else:
+            if 'date' not in df.columns:
+                raise ValueError('No "date" fieldname found.')
+
+            fields = {name: i for i, name in enumerate(df.columns)}
+            return fields, df.itertuples(index=False, name=None)
+
+    with open(csvfile, 'r') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header or 'date' not in header:
+            raise ValueError('No "date" fieldname found.')
+
+        fields = {name: i for i, name in enumerate(header)}
+        return fields, list(reader)
+
+
+def _read_csv_worker(csvfile):
+    """ Worker for Ledger.loadCsvs.
+
+    Runs in a worker process, so everything returned must pickle.
+
+    Args:
+        csvfile: csv file to read.
+
+    Returns:
+        See _read_csv, with the rows materialized as a list.
+
+    Raises:
+        ValueError decorated with the csv name.
+    """
+    try:
+        fields, rows = _read_csv(csvfile)
+        return fields, list(rows)
+    except ValueError as ve:
+        raise ValueError('CSV {}: {}'.format(csvfile, ve))
+
+
 def suggest_notes(src, dest, amount):
     """ Create an automatic notes suggestion.
 
@@ -63,6 +195,22 @@ class Ledger:
         # Number of times "addTransactions" is called.
         self.num_adds = 0
 
+        # Cache of account-string resolutions for suggestAccount.
+        self._suggest_cache = {}
+
+        # True while self.transactions is known to be date-sorted.
+        self._is_sorted = True
+
+        # Structure-of-arrays mirrors of self.transactions; day
+        # ordinals and account-name indices, appended in step with the
+        # transaction list. numpy views are built lazily from these.
+        self._names = []
+        self._name_idx = {}
+        self._days = []
+        self._src_idx = []
+        self._dest_idx = []
+        self._arrays = None
+
     def clear(self):
         """ Clear the ledger and start from scratch.
         """
@@ -70,15 +218,48 @@ class Ledger:
         self.transactions = []
         self.dupes = DupeTracker(self.duplicate_window)
         self.num_adds = 0
+        self._suggest_cache = {}
+        self._is_sorted = True
+        self._names = []
+        self._name_idx = {}
+        self._days = []
+        self._src_idx = []
+        self._dest_idx = []
+        self._arrays = None
 
     def sort(self):
         """ Sort the ledger's transactions by date.
         """
         self.transactions.sort()
-        for key, val in self.accounts.items():
-            val.transactions.sort()
 
-    def dump(self, filter=lambda x: True):
+        # Each account's list is a subsequence of the ledger's, so one
+        # linear pass through the sorted ledger rebuilds them all in
+        # near-sorted order; cheaper than sorting every account's list
+        # from scratch.
+        for account in self.accounts.values():
+            account.transactions.clear()
+        for t in self.transactions:
+            t.src.transactions.append(t)
+            if t.dest is not t.src:
+                t.dest.transactions.append(t)
+
+        # SuperDate compares a plain date equal to any time on that
+        # day, so the ledger order is not total and restricting it to a
+        # subsequence can surface same-day time inversions. A final
+        # per-account sort fixes those; timsort is adaptive, so it
+        # stays near-linear on the rebuilt lists.
+        for account in self.accounts.values():
+            account.transactions.sort()
+
+        self._is_sorted = True
+
+        # Realign the SoA mirrors with the new order.
+        self._days = [t.date.toordinal() for t in self.transactions]
+        self._src_idx = [self._name_idx[t.src.name] for t in self.transactions]
+        self._dest_idx = [self._name_idx[t.dest.name] for t in self.transactions]
+        self._arrays = None
+
+    def dump(self, filter=lambda x: True, accounts=None, start=None, end=None):
         """ Dump contents of ledger as csv string.
 
         This function can filter for Transactions.
@@ -86,28 +267,174 @@ class Ledger:
         Args:
             func: Function that returns True or False when
                 provided with a Transaction.
+            accounts: See getTransactions.
+            start: See getTransactions.
+            end: See getTransactions.
 
         Returns:
             The leddger's content's as a CSV string.
         """
         h = ['date,src,dest,amount,tags,notes']
-        body = [str(t) for t in self.getTransactions(filter)]
+        body = [str(t) for t in self.getTransactions(filter, accounts, start, end)]
         return '\n'.join(h + body)
 
-    def getTransactions(self, filter=lambda x: True):
+    def getTransactions(self, filter=lambda x: True, accounts=None, start=None, end=None):
         """ Retrieve a list of filtered transactions.
 
+        The accounts, start, and end filters narrow the scan before the
+        general filter runs. Account names use the ledger's per-account
+        transaction lists rather than scanning the whole ledger, and
+        date bounds bisect a sorted ledger instead of testing each row.
+
         Args:
             func: Function that returns True or False when provided
-                with a Transaction.
+                with a Transaction, or a str conditional on 't' to be
+                compiled into one.
+            accounts: Only consider transactions involving these
+                account names.
+            start: Only consider transactions on or after this date.
+            end: Only consider transactions on or before this date.
 
         Returns:
             List of internal transaction references.
         """
         if type(filter) is str:
-            return [t for t in self.transactions if eval(filter)]
-        elif callable(filter):
-            return [t for t in self.transactions if filter(t)]
+            # Compile the conditional once up front; eval'ing the raw
+            # string re-parsed it for every transaction.
+            filter = eval('lambda t: ({})'.format(filter))
+
+        candidates = self.transactions
+
+        start = SuperDate(start) if start is not None else None
+        end = SuperDate(end) if end is not None else None
+
+        # Day-granularity bounds can be tested against the day-ordinal
+        # arrays; a bound with a time element needs SuperDate compares.
+        day_bounds = (
+            (start is None or type(start._date) is date)
+            and (end is None or type(end._date) is date))
+
+        if (np is not None and day_bounds
+                and (accounts is not None or start is not None or end is not None)):
+            candidates = self._narrowArrays(accounts, start, end)
+            if callable(filter):
+                return [t for t in candidates if filter(t)]
+
+        if accounts is not None:
+            wanted = set()
+            for name in accounts:
+                account = self.accounts.get(name)
+                if account is not None:
+                    wanted.update(id(t) for t in account.transactions)
+
+            # Collect in ledger order so results match the vectorized
+            # path regardless of the caller's account-name order.
+            candidates = [t for t in self.transactions if id(t) in wanted]
+
+        if start is not None or end is not None:
+            # The bisect shortcut also needs day-granularity bounds; a
+            # bound with a time element compares equal to every plain
+            # date on its day, which breaks the monotonic ordering
+            # binary search relies on.
+            if candidates is self.transactions and self._is_sorted and day_bounds:
+                lo = self._bisectLeft(start) if start is not None else 0
+                hi = self._bisectRight(end) if end is not None else len(candidates)
+                candidates = candidates[lo:hi]
+            else:
+                candidates = [
+                    t for t in candidates
+                    if (start is None or t.date >= start)
+                    and (end is None or t.date <= end)]
+
+        if callable(filter):
+            return [t for t in candidates if filter(t)]
+
+    def _nameIndex(self, name):
+        """ Index of an account name in the SoA name table.
+
+        Unseen names are assigned the next free index.
+        """
+        idx = self._name_idx.get(name)
+        if idx is None:
+            idx = len(self._names)
+            self._name_idx[name] = idx
+            self._names.append(name)
+        return idx
+
+    def _narrowArrays(self, accounts, start, end):
+        """ Vectorized candidate narrowing over the SoA mirrors.
+
+        Requires numpy and day-granularity bounds.
+
+        Args:
+            accounts: Iterable of account names, or None.
+            start: SuperDate lower bound, or None.
+            end: SuperDate upper bound, or None.
+
+        Returns:
+            List of matching transaction references, in ledger order.
+        """
+        if self._arrays is None or self._arrays[0].shape[0] != len(self.transactions):
+            self._arrays = (
+                np.array(self._days, dtype='int64'),
+                np.array(self._src_idx, dtype='int32'),
+                np.array(self._dest_idx, dtype='int32'))
+
+        days, src_idx, dest_idx = self._arrays
+
+        acct_mask = None
+        if accounts is not None:
+            acct_mask = np.zeros(len(self._names) + 1, dtype=bool)
+            for name in accounts:
+                idx = self._name_idx.get(name)
+                if idx is not None:
+                    acct_mask[idx] = True
+
+        if _filter_mask is not None:
+            # One fused pass instead of one numpy pass per condition.
+            lo = start.toordinal() if start is not None else np.iinfo(np.int64).min
+            hi = end.toordinal() if end is not None else np.iinfo(np.int64).max
+            if acct_mask is None:
+                acct_mask = np.zeros(1, dtype=bool)
+            mask = _filter_mask(
+                days, src_idx, dest_idx, lo, hi, acct_mask, accounts is not None)
+        else:
+            mask = np.ones(len(days), dtype=bool)
+
+            if start is not None:
+                mask &= days >= start.toordinal()
+            if end is not None:
+                mask &= days <= end.toordinal()
+
+            if acct_mask is not None:
+                mask &= acct_mask[src_idx] | acct_mask[dest_idx]
+
+        transactions = self.transactions
+        return [transactions[i] for i in np.nonzero(mask)[0]]
+
+    def _bisectLeft(self, date):
+        """ First index in sorted self.transactions whose date >= date.
+        """
+        lo, hi = 0, len(self.transactions)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.transactions[mid].date < date:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _bisectRight(self, date):
+        """ First index in sorted self.transactions whose date > date.
+        """
+        lo, hi = 0, len(self.transactions)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.transactions[mid].date <= date:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
 
     def filtered(self, filter=lambda x: True):
         """ Return a ledger consisting only of filtered transactions.
@@ -152,6 +479,10 @@ class Ledger:
     def loadCsvs(self, csvfiles, hints=None, skipinvals=False):
         """ Load ledger from multiple CSVs.
 
+        Parsing is per-file independent, so several files are parsed in
+        parallel worker processes. Transactions are still committed to
+        the ledger serially, in file order, in this process.
+
         Args:
             csvfiles: list of csv filename to load from.
 
@@ -161,7 +492,22 @@ class Ledger:
         Raises:
             See loadCsv.
         """
-        return [t for f in csvfiles for t in self.loadCsv(f, hints, skipinvals)]
+        csvfiles = list(csvfiles)
+        if len(csvfiles) < 2:
+            return [t for f in csvfiles for t in self.loadCsv(f, hints, skipinvals)]
+
+        workers = min(len(csvfiles), os.cpu_count() or 1)
+        newtrans = []
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_read_csv_worker, csvfiles)
+            for csvfile, (fields, rows) in zip(csvfiles, results):
+                thisname = os.path.splitext(os.path.basename(csvfile))[0]
+                try:
+                    newtrans.extend(self._loadRows(rows, fields, thisname, hints, skipinvals))
+                except ValueError as ve:
+                    raise ValueError('CSV {}: {}'.format(csvfile, ve))
+
+        return newtrans
 
     def loadCsv(self, csvfile, hints=None, skipinvals=False):
         """ Load ledger from a single CSV.
@@ -177,11 +523,11 @@ class Ledger:
             where the error ocurred.
         """
         thisname = os.path.splitext(os.path.basename(csvfile))[0]
-        with open(csvfile, 'r') as f:
-            try:
-                return self.load(f, thisname, hints, skipinvals)
-            except ValueError as ve:
-                raise ValueError('CSV {}: {}'.format(csvfile, ve))
+        try:
+            fields, rows = _read_csv(csvfile)
+            return self._loadRows(rows, fields, thisname, hints, skipinvals)
+        except ValueError as ve:
+            raise ValueError('CSV {}: {}'.format(csvfile, ve))
 
     def load(self, lines, thisname='', hints=None, skipinvals=False):
         """ Loads transactions into this ledger from csv-lines.
@@ -203,33 +549,76 @@ class Ledger:
         Raises:
             ValueError: A row from the CSV was invalid.
         """
+        if type(lines) == str:
+            lines = io.StringIO(lines)
+
+        reader = csv.reader(lines)
+        header = next(reader, None)
+        if not header or 'date' not in header:
+            raise ValueError('No "date" fieldname found.')
+
+        fields = {name: i for i, name in enumerate(header)}
+
+        return self._loadRows(reader, fields, thisname, hints, skipinvals)
+
+    def _loadRows(self, rows, fields, thisname='', hints=None, skipinvals=False):
+        """ Load transactions from an iterable of row sequences.
+
+        Args:
+            rows: Iterable of row sequences to load from. Values are
+                strings in the same order as the headings.
+            fields: Dict mapping heading names to column indices. Must
+                contain a 'date' entry.
+            thisname: See load.
+            hints: Hints reference to help with accont creation.
+            skipinvals: Silently pass rows deemed invalid.
+
+        Returns:
+            A list containing internal references to the new transactions.
+
+        Raises:
+            ValueError: A row was invalid.
+        """
         perspective = thisname
         thisname = thisname or 'void.void'
 
-        if type(lines) == str:
-            lines = io.StringIO(lines)
+        # Resolve column indices once rather than per-row key lookups.
+        idx_date = fields['date']
+        idx_src = fields.get('src')
+        idx_dest = fields.get('dest')
+        idx_amount = fields.get('amount')
+        idx_tags = fields.get('tags')
+        idx_notes = fields.get('notes')
 
         newtrans = []
-        reader = csv.DictReader(lines)
-        if 'date' not in reader.fieldnames:
-            raise ValueError('No "date" fieldname found.')
 
         # keep track of currency suggestions within this spreadsheet.
         line_num = 2
-        for row in reader:
+        for row in rows:
+            if not row:
+                continue
+
+            # Cells missing from short rows read as '' so both csv
+            # backends agree; pandas pads short rows the same way.
+            ncols = len(row)
             try:
-                date = SuperDate(row['date'])
+                date = parse_date(row[idx_date] if idx_date < ncols else '')
 
                 notes = ''
-                if 'notes' in row:
-                    notes = row['notes']
+                if idx_notes is not None and idx_notes < ncols:
+                    notes = row[idx_notes]
 
                 # determine src and dest accounts.
                 src = None
                 dest = None
 
-                src_line = row['src'] if 'src' in row else None
-                dest_line = row['dest'] if 'dest' in row else None
+                src_line = None
+                if idx_src is not None:
+                    src_line = row[idx_src] if idx_src < ncols else ''
+
+                dest_line = None
+                if idx_dest is not None:
+                    dest_line = row[idx_dest] if idx_dest < ncols else ''
 
                 # will raise ValueError if invalid.
                 if src_line is not None:
@@ -244,9 +633,11 @@ class Ledger:
                 # determine what currencies to use and validate amount
                 suggestion = self.primary_currency
 
-                try:
-                    amount = Amount.createFromStr(row['amount'], suggestion)
-                except KeyError:
+                if idx_amount is not None:
+                    amount = Amount.createFromStr(
+                        row[idx_amount] if idx_amount < ncols else '',
+                        suggestion)
+                else:
                     amount = Amount(suggestion, 0, suggestion, 0)
 
                 # src amount should always be negative.
@@ -256,9 +647,10 @@ class Ledger:
 
                 notes = notes or suggest_notes(src_line, dest_line, amount)
 
-                tags = set()
-                if 'tags' in row and row['tags']:
-                    tags = {x.strip() for x in row['tags'].split(':') if x.strip()}
+                # Transaction copies the tags into its own set.
+                tags = None
+                if idx_tags is not None and idx_tags < ncols and row[idx_tags]:
+                    tags = _split_tags(row[idx_tags])
 
                 # will raise ValueError if invalid.
                 t = Transaction(date, src, dest, amount, tags, notes)
@@ -340,7 +732,12 @@ class Ledger:
         if orig is not None:
             orig.addTags(t.tags)
         else:
+            if self.transactions and t.date < self.transactions[-1].date:
+                self._is_sorted = False
             self.transactions.append(t)
+            self._days.append(t.date.toordinal())
+            self._src_idx.append(self._nameIndex(t.src.name))
+            self._dest_idx.append(self._nameIndex(t.dest.name))
             t.src.addTransaction(t)
             if t.src is not t.dest:
                 t.dest.addTransaction(t)
@@ -365,8 +762,15 @@ class Ledger:
         s = thisname if s == 'this' else s
         s = 'void.void' if s == 'void' else s
 
+        # The same raw string resolves to the same name every time, so
+        # cache the parse and hints lookup. A fresh Account is still
+        # constructed per call - accounts must stay unshared.
+        key = (s, hints)
+        if key in self._suggest_cache:
+            return Account(self._suggest_cache[key])
+
         try:
-            return Account(s)
+            account = Account(s)
         except ValueError as ve:
 
             if not hints:
@@ -377,12 +781,15 @@ class Ledger:
                 raise ValueError('No suggestion for "{}".'.format(s))
 
             try:
-                return Account(suggestion)
+                account = Account(suggestion)
             except ValueError as ve:
                 raise ValueError(
                     '"{}" generated the suggestion "{}", '
                     'which is invalid: {}.'.format(s, suggestion, ve))
 
+        self._suggest_cache[key] = account.name
+        return account
+
     def addAccount(self, account):
         """ Add an account to this ledger.
 
@@ -2,6 +2,7 @@
 """
 
 import copy
+import functools
 from datetime import datetime
 
 from superdate import SuperDate
@@ -10,8 +11,84 @@ from daybook.Account import Account
 from daybook.Amount import Amount
 
 
+# Common fixed formats for CSV date columns. Tried before handing the
+# string to SuperDate's general-purpose parser.
+_date_fmts = [
+    '%Y-%m-%d',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y/%m/%d',
+]
+
+
+def _fast_date(s):
+    """ Parse a date string against a few fixed formats.
+
+    Most CSVs use a single fixed date format, so strptime against
+    these is much cheaper than a general-purpose date parser. The
+    matching format is moved to the front of the list so runs of
+    same-format rows only ever try one format.
+
+    Args:
+        s: The date string to parse.
+
+    Returns:
+        A date or datetime, or None if s matched no known format.
+    """
+    try:
+        d = datetime.fromisoformat(s)
+    except ValueError:
+        d = None
+
+    if d is None:
+        for i, fmt in enumerate(_date_fmts):
+            try:
+                d = datetime.strptime(s, fmt)
+            except ValueError:
+                continue
+
+            if i:
+                _date_fmts.insert(0, _date_fmts.pop(i))
+            break
+
+    if d is None:
+        return None
+
+    # Mirror SuperDate; dates with no time element are plain dates.
+    if (d.hour, d.minute, d.second, d.microsecond) == (0, 0, 0, 0):
+        d = d.date()
+
+    return d
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_date(s):
+    """ Parse a date string into a SuperDate.
+
+    Results are memoized; ledgers repeat the same small set of date
+    strings many times, so repeated rows become dict lookups. Sharing
+    the SuperDate references is safe because they are immutable.
+
+    Args:
+        s: The date string to parse.
+
+    Returns:
+        A SuperDate.
+
+    Raises:
+        ValueError if s could not be parsed.
+    """
+    d = _fast_date(s)
+    return SuperDate(d) if d is not None else SuperDate(s)
+
+
 class Transaction:
 
+    # Fixed attribute set; transactions are created per CSV row, so
+    # skipping the per-instance __dict__ saves real memory.
+    __slots__ = (
+        'date', 'src', 'dest', 'amount', 'tags', 'notes',
+        'accounts', 'quantity', '_hash')
+
     def __init__(self, date, src, dest, amount, tags=None, notes=''):
 
         if not type(src) == Account or not type(dest) == Account:
@@ -20,7 +97,16 @@ class Transaction:
         if not type(amount) == Amount:
             raise ValueError('amount must be of type Amount')
 
-        self.date = SuperDate(date)
+        # SuperDates are immutable, so share the reference and only pay
+        # for a parse when given something else. Strings get a strptime
+        # fast path before falling back to SuperDate's general parser.
+        if type(date) is SuperDate:
+            self.date = date
+        elif type(date) is str:
+            self.date = parse_date(date)
+        else:
+            self.date = SuperDate(date)
+
         self.src = src
         self.dest = dest
         self.amount = copy.copy(amount)
@@ -33,11 +119,7 @@ class Transaction:
         self.quantity = max(abs(self.amount.src_amount), abs(self.amount.dest_amount))
 
         # this key information shouln't ever be modified.
-        self._hash = hash('{}{}{}{}'.format(
-            self.date,
-            self.src.name,
-            self.dest.name,
-            self.amount))
+        self._hash = hash((self.date, self.src.name, self.dest.name, self.amount))
 
     def __str__(self):
         """ Return transaction as a complete csv row.
@@ -1,7 +1,9 @@
 import os
+import sys
 from argparse import RawDescriptionHelpFormatter
 from pathlib import Path
 
+from daybook.client.load import readdir_
 from daybook.client.parsergroups import create_csv_opts, create_filter_opts
 from daybook.client.cli.report.main import report_filter
 from daybook.util.importer import import_modules
@@ -18,9 +20,20 @@ def add_reporter_subparsers(subparsers, parents):
 
     paths = os.environ['DAYBOOK_REPORTERS'].split(':')
 
-    keys = ['help', 'description']
-    reporters = import_modules(paths, report_filter, keys)
-    reporters = {k: reporters[k] for k in sorted(reporters)}
+    # Importing every reporter just to register its name makes plain
+    # dispatch pay for modules that will never run; main imports the
+    # chosen reporter itself. Only import them all when their help
+    # text will actually be displayed.
+    if '-h' in sys.argv or '--help' in sys.argv:
+        keys = ['help', 'description']
+        reporters = import_modules(paths, report_filter, keys)
+        reporters = {k: reporters[k] for k in sorted(reporters)}
+    else:
+        names = set()
+        for path in paths:
+            _, _, files = readdir_(path)
+            names.update(f[:-3] for f in files if f.endswith('.py'))
+        reporters = {name: ('', '') for name in sorted(names)}
 
     for name, tupe in reporters.items():
         help, description = tupe
@@ -174,7 +174,7 @@ class DupeTracker:
         act = []
 
         for t in transactions:
-            bucket = self.buckets[self._hash(t)]
+            bucket = self.buckets.get(self._hash(t), [])
 
             for group in bucket:
                 o, a = group.find_perspectives(t)
@@ -189,7 +189,9 @@ class DupeTracker:
     def _hash(self, transaction):
         """ Use this function to lookup transactions in the buckets.
 
-        DupeTracker omits transaction dates as part of their hashes.
+        DupeTracker omits transaction dates as part of their keys. The
+        key is a tuple rather than a formatted string so lookups don't
+        allocate anything.
         """
         t = transaction
-        return '{}{}{}'.format(t.src.name, t.dest.name, t.amount)
+        return (t.src.name, t.dest.name, t.amount)
@@ -30,6 +30,7 @@ if 'DEBBUILD' not in os.environ:
     install_requires = [
         'argcomplete >= 1.0',
         'prettytable',
+        'pyahocorasick',
         'pyaml',
         'superdate',
     ]
@@ -138,6 +138,54 @@ class TestAccount(unittest.TestCase):
         self.assertEqual(-3.33, a.balances['jpy'])
         self.assertEqual(10, a.balances['usd'])
 
+    def test_balance_no_window(self):
+        """ balance with no bounds should match the running balances.
+        """
+        a = Account('asset.a')
+        b = Account('asset.b')
+        t = Transaction('2021-01-01', a, b, amount)
+        a.addTransaction(t)
+        b.addTransaction(t)
+
+        self.assertEqual(dict(a.balances), a.balance())
+        self.assertEqual(dict(b.balances), b.balance())
+
+    def test_balance_window(self):
+        """ balance should only count transactions within the bounds.
+        """
+        a = Account('asset.a')
+        b = Account('asset.b')
+        for day in ['2021-01-01', '2021-02-01', '2021-03-01']:
+            t = Transaction(day, a, b, amount)
+            a.addTransaction(t)
+            b.addTransaction(t)
+
+        self.assertEqual(-30, a.balance()['jpy'])
+        self.assertEqual(-20, a.balance(start='2021-02-01')['jpy'])
+        self.assertEqual(-10, a.balance(end='2021-01-31')['jpy'])
+        self.assertEqual(-10, a.balance('2021-01-15', '2021-02-15')['jpy'])
+        self.assertEqual(10, b.balance(end='2021-01-01')['jpy'])
+
+    def test_balance_window_pure_python(self):
+        """ The fallback loop should agree with the vectorized path.
+        """
+        import daybook.Account as module
+
+        a = Account('asset.a')
+        b = Account('asset.b')
+        for day in ['2021-01-01', '2021-02-01', '2021-03-01']:
+            t = Transaction(day, a, b, amount)
+            a.addTransaction(t)
+            b.addTransaction(t)
+
+        saved = module.np
+        module.np = None
+        try:
+            self.assertEqual(-20, a.balance(start='2021-02-01')['jpy'])
+            self.assertEqual(-10, a.balance(end='2021-01-31')['jpy'])
+        finally:
+            module.np = saved
+
     def test_type_prefix(self):
         """ Prefixes of types should match.
         """
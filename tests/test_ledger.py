@@ -181,6 +181,30 @@ class TestLedger(unittest.TestCase):
         self.assertEqual(0, len(ledger.accounts))
         self.assertEqual(0, len(ledger.transactions))
 
+    def test_ragged_rows(self):
+        """ Both csv backends should agree on ragged files.
+
+        Rows with extra trailing fields load normally, and rows missing
+        cells named by the header read those cells as empty and are
+        rejected like any other invalid row.
+        """
+        import daybook.Ledger as module
+
+        saved = module.pd
+        for backend in (saved, None):
+            module.pd = backend
+            try:
+                ledger = Ledger(pcurr)
+                ledger.loadCsv('{}/ragged.csv'.format(resources))
+
+                self.assertEqual(1, len(ledger.transactions))
+                self.assertEqual(-5, ledger.accounts['asset.a'].balances['usd'])
+
+                with self.assertRaises(ValueError):
+                    ledger.loadCsv('{}/short-row.csv'.format(resources))
+            finally:
+                module.pd = saved
+
     def test_this_substitution(self):
         """Verify behavior for transactions on 'this'.
 
@@ -263,6 +287,124 @@ class TestLedger(unittest.TestCase):
         for e in expected:
             self.assertTrue(e in ledger.transactions[0].tags)
 
+    def test_sort(self):
+        """ sort should order the ledger and every account list.
+
+        Mixed date / datetime rows are the tricky case; a plain date
+        compares equal to any time that day, so account lists need
+        their own sort pass to order same-day times.
+        """
+        lines = (
+            'date,src,dest,amount\n'
+            '2021-10-24 20:13:16,asset.checking,expense.food,-10\n'
+            '2021-10-24,asset.checking,expense.grocery,-20\n'
+            '2021-10-24 13:09:43,asset.checking,expense.food,-30\n'
+            '2021-10-23,asset.checking,expense.food,-40')
+        ledger = Ledger(pcurr)
+        ledger.load(lines)
+        ledger.sort()
+
+        food = ledger.accounts['expense.food'].transactions
+        self.assertEqual([-40, -30, -10], [t.amount.src_amount for t in food])
+
+        lists = [ledger.transactions, ledger.accounts['asset.checking'].transactions]
+        for l_ in lists:
+            self.assertEqual(4, len(l_))
+            for a, b in zip(l_, l_[1:]):
+                self.assertFalse(b < a)
+
+    def test_get_transactions_accounts(self):
+        """ getTransactions should narrow by account name.
+        """
+        lines = (
+            'date,src,dest,amount\n'
+            '2021-01-01,asset.a,expense.b,-10\n'
+            '2021-01-02,asset.a,expense.c,-10')
+        ledger = Ledger(pcurr)
+        ledger.load(lines)
+
+        ts = ledger.getTransactions(accounts=['expense.c'])
+        self.assertEqual(1, len(ts))
+        self.assertEqual('expense.c', ts[0].dest.name)
+
+        ts = ledger.getTransactions(accounts=['asset.a'])
+        self.assertEqual(2, len(ts))
+
+        ts = ledger.getTransactions(accounts=['asset.nope'])
+        self.assertEqual(0, len(ts))
+
+    def test_get_transactions_accounts_order(self):
+        """ Account narrowing should preserve ledger order.
+
+        The numpy and pure-python paths must agree no matter what
+        order the account names are given in.
+        """
+        import daybook.Ledger as module
+
+        lines = (
+            'date,src,dest,amount\n'
+            '2021-01-01,asset.a,expense.b,-1\n'
+            '2021-01-02,asset.x,expense.c,-2\n'
+            '2021-01-03,asset.a,expense.c,-3\n'
+            '2021-01-04,asset.x,expense.b,-4')
+        ledger = Ledger(pcurr)
+        ledger.load(lines)
+
+        expected = [-1, -2, -3, -4]
+        names = ['expense.c', 'expense.b']
+
+        ts = ledger.getTransactions(accounts=names)
+        self.assertEqual(expected, [t.amount.src_amount for t in ts])
+
+        saved = module.np
+        module.np = None
+        try:
+            ts = ledger.getTransactions(accounts=names)
+            self.assertEqual(expected, [t.amount.src_amount for t in ts])
+        finally:
+            module.np = saved
+
+    def test_get_transactions_window(self):
+        """ getTransactions should narrow by date bounds.
+        """
+        lines = (
+            'date,src,dest,amount\n'
+            '2021-01-01,asset.a,expense.b,-10\n'
+            '2021-02-01,asset.a,expense.b,-10\n'
+            '2021-03-01,asset.a,expense.b,-10')
+        ledger = Ledger(pcurr)
+        ledger.load(lines)
+
+        self.assertEqual(2, len(ledger.getTransactions(start='2021-02-01')))
+        self.assertEqual(1, len(ledger.getTransactions(end='2021-01-15')))
+        self.assertEqual(
+            1, len(ledger.getTransactions(start='2021-01-15', end='2021-02-15')))
+
+        # same answers through the per-account path.
+        self.assertEqual(
+            2, len(ledger.getTransactions(accounts=['asset.a'], start='2021-02-01')))
+
+    def test_get_transactions_window_times(self):
+        """ Time-granular bounds must work on a sorted ledger.
+
+        A bound with a time element compares equal to every plain date
+        on its day, so sorted ledgers cannot take the bisect shortcut
+        for these bounds; they need the linear scan.
+        """
+        lines = (
+            'date,src,dest,amount\n'
+            '2021-02-01,asset.a,expense.b,-20\n'
+            '2021-02-01 00:02:00,asset.a,expense.b,-10\n'
+            '2021-01-31,asset.a,expense.b,-30')
+        ledger = Ledger(pcurr)
+        ledger.load(lines)
+        ledger.sort()
+
+        # -10 is before noon and -30 is the prior day; only the plain
+        # date row ties with the bound at day granularity.
+        ts = ledger.getTransactions(start='2021-02-01 12:00:00')
+        self.assertEqual([-20], [t.amount.src_amount for t in ts])
+
     def test_transaction_from_dump(self):
         """ Verify a ledger's dump can populate another ledger.
         """